@@ -4,12 +4,95 @@ Main package.
 
 __version__ = "0.5.2"
 
-from .announcements import *
-from .comments import *
-from .creators import *
-from .discord import *
-from .fanbox import *
-from .files import *
-from .general import *
-from .posts import *
-from .services import *
+# _aux goes first, since core already relies on it
+from ._aux import MILI_DATE_FMT, DEFAULT_DATE_FMT
+from .core import UrlType, clear_json_cache, close_session, configure_pool
+from .announcements import Announcement, ANN_DATE_FMT
+from .comments import Comment, CommentRevision, DEFAULT_COMMENT_DATE_FMT, DEFAULT_REV_DATE_FMT
+from .creators import (
+    Creator,
+    CreatorDict,
+    CreatorKey,
+    CreatorsList,
+    AnnouncementsList,
+    FancardsList,
+    PROFILES_CACHE_MAXSIZE,
+    clear_profile_cache,
+)
+from .discord import (
+    DiscordChannel,
+    DiscordMessage,
+    DiscordUser,
+    ChannelsList,
+    MessagesList,
+    MSG_DATE_FMT,
+    OFFSET_STEPPING,
+)
+from .fanbox import Fancard, FANC_DATE_FMT
+from .files import File, FileDict, FilesList, BAR_WIDTH, clear_saved_files_cache
+from .general import (
+    FileHashResult,
+    MAX_POSTS_LIMIT,
+    get_app_version,
+    get_creator,
+    get_creator_links,
+    get_creators,
+    get_file_hash,
+    get_posts,
+)
+from .posts import Post, PostRevision, PostsList, CommentsList, PostRevsList, ELEMENTS_PER_PAGE
+from .services import ServiceType, ServiceLike, to_service
+
+__all__ = [
+    "UrlType",
+    "clear_json_cache",
+    "close_session",
+    "configure_pool",
+    "MILI_DATE_FMT",
+    "DEFAULT_DATE_FMT",
+    "Announcement",
+    "ANN_DATE_FMT",
+    "Comment",
+    "CommentRevision",
+    "DEFAULT_COMMENT_DATE_FMT",
+    "DEFAULT_REV_DATE_FMT",
+    "Creator",
+    "CreatorDict",
+    "CreatorKey",
+    "CreatorsList",
+    "AnnouncementsList",
+    "FancardsList",
+    "PROFILES_CACHE_MAXSIZE",
+    "clear_profile_cache",
+    "DiscordChannel",
+    "DiscordMessage",
+    "DiscordUser",
+    "ChannelsList",
+    "MessagesList",
+    "MSG_DATE_FMT",
+    "OFFSET_STEPPING",
+    "Fancard",
+    "FANC_DATE_FMT",
+    "File",
+    "FileDict",
+    "FilesList",
+    "BAR_WIDTH",
+    "clear_saved_files_cache",
+    "FileHashResult",
+    "MAX_POSTS_LIMIT",
+    "get_app_version",
+    "get_creator",
+    "get_creator_links",
+    "get_creators",
+    "get_file_hash",
+    "get_posts",
+    "Post",
+    "PostRevision",
+    "PostsList",
+    "CommentsList",
+    "PostRevsList",
+    "ELEMENTS_PER_PAGE",
+    "ServiceType",
+    "ServiceLike",
+    "to_service",
+]
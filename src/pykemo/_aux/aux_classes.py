@@ -2,16 +2,17 @@
 Auxiliar classes module.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Sequence
 
 if TYPE_CHECKING:
-    from ..discord import MessagesList
+    from ..discord import DiscordMessage
     from ..files import File
-    from ..posts import PostsList
+    from ..posts import Post
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class FileHashResult:
     """
     Result used when querying for a file using its hash.
@@ -21,21 +22,105 @@ class FileHashResult:
     :param disc: All the discord messages where this file is.
 
     :type file: :class:`.File`
-    :type posts: list[:class:`.Post`]
-    :type disc: list[:class:`.DiscordMessage`]
+    :type posts: Sequence[:class:`.Post`]
+    :type disc: Sequence[:class:`.DiscordMessage`]
     """
 
     file: Optional["File"]
-    posts: "PostsList"
-    disc: "MessagesList"
+    posts: Sequence["Post"]
+    disc: Sequence["DiscordMessage"]
 
 
     @classmethod
     def empty(cls) -> "FileHashResult":
         """
-        :return: An instance of the result with empty fields.
+        :return: The instance of the result with empty fields. It is shared, so it's
+                 always the same object; since results are frozen, it can't be changed.
 
         :rtype: :class:`.FileHashResult`
         """
 
-        return cls(None, [], [])
+        return _EMPTY_FILE_HASH_RESULT
+
+
+_EMPTY_FILE_HASH_RESULT: FileHashResult = FileHashResult(file=None, posts=(), disc=())
+"""
+The empty result, returned by :meth:`.FileHashResult.empty`.
+"""
+
+
+class LRUCache:
+    """
+    A mapping that remembers up to a number of items. When full, the least recently used
+    item is dropped to make room for a new one. Both reading and storing an item count
+    as using it.
+    """
+
+    __slots__ = ("maxsize", "_items")
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initializes an empty cache.
+
+        :param maxsize: How many items to remember at most.
+
+        :type maxsize: :class:`int`
+        """
+
+        self.maxsize: int = maxsize
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+
+
+    def __len__(self) -> int:
+        """
+        :return: How many items are remembered.
+        :rtype: :class:`int`
+        """
+
+        return len(self._items)
+
+
+    def get(self, key: Hashable, default: Any=None) -> Any:
+        """
+        Retrieves an item, marking it as the most recently used.
+
+        :param key: The key of the item.
+        :param default: What to return if the item is not remembered.
+
+        :type key: :class:`Hashable`
+        :type default: :class:`Any`
+
+        :return: The item, or `default` if not remembered.
+        :rtype: :class:`Any`
+        """
+
+        if key not in self._items:
+            return default
+
+        self._items.move_to_end(key)
+        return self._items[key]
+
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Remembers an item, dropping the least recently used one if there is no more room.
+
+        :param key: The key of the item.
+        :param value: The item itself.
+
+        :type key: :class:`Hashable`
+        :type value: :class:`Any`
+        """
+
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+
+    def clear(self) -> None:
+        """
+        Forgets every item.
+        """
+
+        self._items.clear()
@@ -2,21 +2,23 @@
 Auxiliar functions module.
 """
 
+from contextlib import closing
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional, TypeAlias, Union
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, TypeAlias, Union
 
 from grequests import map as async_map
 
-from ..core import async_get, get
+from ..core import async_get, imap_requests, json_body
 
 if TYPE_CHECKING:
-    from requests import Response
+    from grequests import AsyncRequest
 
     from ..core import UrlLike
     from ..files import FileDict
 
 DateOrFmt: TypeAlias = Union[str, datetime]
 ParamsFmtDict: TypeAlias = dict[str, Union[str, int]]
+DateFilter: TypeAlias = Callable[[str], tuple[datetime, bool]]
 
 DEFAULT_DATE_FMT: str = r"%Y-%m-%dT%H:%M:%S"
 "The default date formatting to use."
@@ -34,6 +36,22 @@ DEFAULT_BATCH_SEND_SIZE: int = 10
 Inside the batch, how many asynchronous requests to send at a time.
 """
 
+PAGES_WINDOW: int = 10
+"""
+How many pages to request concurrently at a time when fetching posts synchronously.
+"""
+
+
+def _reraise(_: "AsyncRequest", exception: Exception) -> None:
+    """
+    .. warning:: `(for internal purposes)`
+    Exception handler for asynchronous maps that should fail just like a synchronous request would.
+
+    :raises Exception: The exception the request failed with.
+    """
+
+    raise exception
+
 
 def sanitize_data_url(file_dict: "FileDict") -> "FileDict":
     """
@@ -87,6 +105,34 @@ def process_date(date: DateOrFmt, fmt: Optional[str]) -> datetime:
     return date
 
 
+def parse_date(date: DateOrFmt) -> datetime:
+    """
+    Parses a date string as the API sends them, that is, ``YYYY-MM-DDTHH:MM:SS[.ffffff]``.
+    It's much faster than :meth:`datetime.datetime.strptime`, which it only falls back to
+    if the string is not understood otherwise. A trailing ``Z`` is ignored, so that every
+    date stays naive and they can be compared with each other. A date already parsed is
+    returned as-is.
+
+    :param date: The date string in question.
+
+    :type date: :class:`str` | :class:`datetime.datetime`
+
+    :return: A processed :class:`datetime.datetime` object.
+    :rtype: :class:`datetime.datetime`
+    """
+
+    if isinstance(date, datetime):
+        return date
+
+    if date.endswith("Z"):
+        date = date[:-1]
+
+    try:
+        return datetime.fromisoformat(date)
+    except ValueError:
+        return datetime.strptime(date, (MILI_DATE_FMT if "." in date else DEFAULT_DATE_FMT))
+
+
 def before_date(date1: DateOrFmt,
                 date2: DateOrFmt,
                 *,
@@ -137,6 +183,30 @@ def since_date(date1: DateOrFmt,
     return process_date(date1, fmt1) >= process_date(date2, fmt2)
 
 
+def date_filter(before: Optional[datetime]=None, since: Optional[datetime]=None) -> DateFilter:
+    """
+    Builds a function that parses a date string, as the API sends them, and checks if it is
+    within bounds. This way the bounds are only processed once, and each date string only once
+    as well, since the parsed date is given back to be used instead of the string.
+
+    :param before: If given, the dates must be before this one.
+    :param since: If given, the dates must be after or equal to this one.
+
+    :type before: Optional[:class:`datetime.datetime`]
+    :type since: Optional[:class:`datetime.datetime`]
+
+    :return: A function that returns the parsed date, and ``True`` if it is within the bounds.
+    :rtype: :type:`DateFilter`
+    """
+
+    def in_bounds(date: str) -> tuple[datetime, bool]:
+        parsed = parse_date(date)
+        return (parsed, ((before is None or parsed < before) and
+                         (since is None or parsed >= since)))
+
+    return in_bounds
+
+
 def query_params(query: Optional[str]=None,
                  offset: Optional[int]=None,
                  stepping: int=0) -> ParamsFmtDict:
@@ -152,6 +222,8 @@ def query_params(query: Optional[str]=None,
     :type offset: Optional[:class:`int`]
     :type stepping: :class:`int`
 
+    :raises ValueError: If `offset` is not a multiple of `stepping`.
+
     :return: A dictionary already poblated with the parameters.
     :rtype: :type:`ParamsFmtDict`
     """
@@ -159,71 +231,93 @@ def query_params(query: Optional[str]=None,
     params = {}
 
     if query is not None:
-        params.update(q=query)
+        params["q"] = query
 
     if offset is not None:
         if offset % stepping != 0:
             raise ValueError(f"Value for offset {offset} not valid."
                                 f" Must be a multiple of {stepping}.")
-        offset_val = offset
+        params["o"] = offset
 
-
-    params.update(o=offset_val)
     return params
 
 
+def _page_windows(send_size: int) -> Iterator[range]:
+    """
+    .. warning:: `(for internal purposes)`
+    Splits the page numbers into windows to request at a time, for when it is not known how
+    many pages there are. The first window has a single page, and each one doubles the last
+    up to `send_size`, so that few pages are requested past the last one when there are few.
+
+    :param send_size: The biggest a window can get.
+
+    :type send_size: :class:`int`
+
+    :return: An endless generator of the page numbers of each window.
+    :rtype: Iterator[:class:`range`]
+    """
+
+    start, size = 0, 1
+    while True:
+        yield range(start, start + size)
+        start += size
+        size = min(size * 2, send_size)
+
+
 def get_posts_responses(*,
                         endpoint: "UrlLike",
                         query: Optional[str]=None,
                         max_posts: Optional[int]=None,
-                        page_stepping: int) -> list["Response"]:
+                        page_stepping: int,
+                        batch_send_size: Optional[int]=None) -> Iterator[dict]:
     """
-    Gets the responses of posts by page.
+    Gets the responses of posts by page. The pages are requested concurrently, in windows
+    of at most `batch_send_size` pages, each one only after the last has arrived whole.
+    When fetching all the posts, the windows start small, and no more of them are requested
+    once the last page is found, that is, the first one that isn't full.
 
     :param endpoint: The endpoint that the request will map to.
     :param query: A search query string to filter the results.
     :param max_posts: The max posts to fit into the final list.
     :param page_stepping: The stepping of the paging.
+    :param batch_send_size: How many pages to request at the same time. Defaults to :attr:`PAGES_WINDOW`.
 
     :type endpoint: :type:`UrlLike`
     :type query: Optional[:class:`str`]
     :type max_posts: Optional[:class:`int`]
     :type page_stepping: :class:`int`
+    :type batch_send_size: Optional[:class:`int`]
 
-    :return: A list of :class:`requests.Response`, to be further processed.
-    :rtype: list[`Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_]
+    :return: A generator of the fields of each post, to be further processed.
+    :rtype: Iterator[:class:`dict`]
     """
 
-    responses = []
+
+    def page_request(page: int) -> "AsyncRequest":
+        return async_get(endpoint, params=query_params(query, page * page_stepping, page_stepping))
+
+    send_size = (batch_send_size if batch_send_size is not None else PAGES_WINDOW)
 
     if max_posts is None: # Try to get ALL the posts
-        cur_page = 0
-        while True:
-            page_response = get(endpoint,
-                                params=query_params(query,
-                                                    cur_page * page_stepping,
-                                                    page_stepping))
-            if page_response.status_code != 429:
-                responses.extend(page_response.json())
+        for pages in _page_windows(send_size):
+            window = (page_request(page) for page in pages)
+            for page_response in async_map(window, size=send_size, exception_handler=_reraise):
+                if page_response.status_code == 429:
+                    continue
 
-            if  not page_response.json():
-                break
+                body = json_body(page_response)
+                yield from body
 
-            cur_page += 1
+                if len(body) < page_stepping: # only the last page isn't full
+                    return
 
     else:
         n_pages = (max_posts // page_stepping) + 1 # one more for the surplus
-        for page in range(n_pages):
-            page_response = get(endpoint,
-                                params=query_params(query,
-                                                    page * page_stepping,
-                                                    page_stepping))
-
+        window = (page_request(page) for page in range(n_pages))
+        for page_response in async_map(window, size=send_size, exception_handler=_reraise):
             # by this point, one would expect this to be a list of posts
             if page_response.status_code != 429:
-                responses.extend(page_response.json())
-
-    return responses
+                yield from json_body(page_response)
 
 
 def async_get_posts_responses(*,
@@ -231,9 +325,13 @@ def async_get_posts_responses(*,
                               query: Optional[str]=None,
                               max_posts: Optional[int]=None,
                               page_stepping: int,
-                              batch_send_size: Optional[int]=None) -> list["Response"]:
+                              batch_send_size: Optional[int]=None) -> Iterator[dict]:
     """
-    Gets the asynchronous responses of posts by page.
+    Gets the asynchronous responses of posts by page. No more than `batch_send_size` pages
+    are requested at any given time, and each page is yielded as soon as it and the ones
+    before it arrive. When fetching all the posts, the pages are requested in windows that
+    start small, and no more of them are requested once the last page is found, that is,
+    the first one that isn't full.
 
     :param endpoint: The endpoint that the request will map to.
     :param query: A search query string to filter the results.
@@ -247,46 +345,35 @@ def async_get_posts_responses(*,
     :type page_stepping: :class:`int`
     :type batch_send_size: Optional[:class:`int`]
 
-    :return: A list of :class:`requests.Response`, to be further processed.
-    :rtype: list[`Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_]
+    :return: A generator of the fields of each post, to be further processed.
+    :rtype: Iterator[:class:`dict`]
     """
 
-    responses = []
-    exit_flag = False
-    send_size = (DEFAULT_BATCH_SEND_SIZE if batch_send_size is not None else batch_send_size)
 
-    if max_posts is None: # Try to get ALL the posts
-        cur_page = 0
-        while not exit_flag:
-            req_batch = []
-            for _ in range(ASYNC_FETCH_BATCH):
-                page_async_req = async_get(
-                    endpoint,
-                    params=query_params(query,
-                                        cur_page * page_stepping,
-                                        page_stepping))
-                req_batch.append(page_async_req)
-                cur_page += 1
-
-            res_batch = async_map(req_batch, size=send_size)
-
-            for page_response in res_batch:
-                if page_response.status_code != 429:
-                    responses.extend(page_response.json())
-                    if not page_response.json():
-                        exit_flag = True
+    def page_requests(pages: Iterable[int]) -> Iterator["AsyncRequest"]:
+        return (async_get(endpoint, params=query_params(query, page * page_stepping, page_stepping))
+                for page in pages)
 
-    else:
+    send_size = (batch_send_size if batch_send_size is not None else DEFAULT_BATCH_SEND_SIZE)
+
+    if max_posts is not None:
         n_pages = (max_posts // page_stepping) + 1 # one more for the surplus
-        req_batch = (async_get(endpoint,
-                                params=query_params(query,
-                                                    page * page_stepping,
-                                                    page_stepping))
-                    for page in range(n_pages))
-        res_batch = async_map(req_batch, size=send_size)
-
-        for res in res_batch:
-            if res.status_code != 429:
-                responses.extend(res.json())
-
-    return responses
+        with closing(imap_requests(page_requests(range(n_pages)), size=send_size)) as responses:
+            for page_response in responses:
+                if page_response.status_code != 429:
+                    yield from json_body(page_response)
+
+        return
+
+    # without a limit, try to get ALL the posts
+    for pages in _page_windows(send_size):
+        with closing(imap_requests(page_requests(pages), size=send_size)) as responses:
+            for page_response in responses:
+                if page_response.status_code == 429:
+                    continue
+
+                body = json_body(page_response)
+                yield from body
+
+                if len(body) < page_stepping: # only the last page isn't full
+                    return
@@ -6,7 +6,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from ..services import ServiceType
+from .._aux import parse_date
+from ..services import ServiceType, to_service
 
 if TYPE_CHECKING:
     from ..creators import Creator
@@ -15,7 +16,7 @@ ANN_DATE_FMT: str = r"%Y-%m-%dT%H:%M:%S.%f"
 "The default format for announcements dates."
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Announcement:
     """
     Announcement tied to a creator. Mainly used in users with Patreon service.
@@ -54,10 +55,10 @@ class Announcement:
         """
 
         return cls(
-            service=ServiceType(fields.get("service")),
+            service=to_service(fields.get("service")),
             creator_id=fields.get("user_id"),
             ann_hash=fields.get("hash"),
             content=fields.get("content", ""),
-            added=datetime.strptime(fields.get("added"), ANN_DATE_FMT),
+            added=parse_date(fields.get("added")),
             creator=fields.get("creator")
         )
@@ -8,7 +8,6 @@ from ..exceptions import (
     IncorrectServiceError,
     NotDiscordError,
     NotFanboxError,
-    PyKemoException,
 )
 from ..services import ServiceType
 
@@ -16,21 +15,6 @@ if TYPE_CHECKING:
     from ..creators import Creator
 
 
-def exc_check(condition: bool, exception: PyKemoException) -> None:
-    """
-    If the condition is True, raises the exception given.
-
-    :param condition: The condition to evaluate.
-    :param exception: The exception object to raise if thing go south.
-
-    :type condition: :class:`bool`
-    :type exception: :class:`.PyKemoException`
-    """
-
-    if condition:
-        raise exception
-
-
 def correct_service_check(creator: "Creator", service: ServiceType) -> None:
     """
     Checks for a correct service.
@@ -40,9 +24,12 @@ def correct_service_check(creator: "Creator", service: ServiceType) -> None:
 
     :type creator: :class:`.Creator`
     :type service: :class:`.ServiceType`
+
+    :raises IncorrectServiceError: If the creator's service is not the expected one.
     """
 
-    exc_check(creator.service != service, IncorrectServiceError(creator.service))
+    if creator.service != service:
+        raise IncorrectServiceError(creator.service)
 
 
 def incorrect_service_check(creator: "Creator", service: ServiceType) -> None:
@@ -54,9 +41,12 @@ def incorrect_service_check(creator: "Creator", service: ServiceType) -> None:
 
     :type creator: :class:`.Creator`
     :type service: :class:`.ServiceType`
+
+    :raises IncorrectServiceError: If the creator's service is the one not expected.
     """
 
-    exc_check(creator.service == service, IncorrectServiceError(service))
+    if creator.service == service:
+        raise IncorrectServiceError(service)
 
 
 def check_if_fanbox(creator: "Creator") -> None:
@@ -66,9 +56,12 @@ def check_if_fanbox(creator: "Creator") -> None:
     :param creator: The creator whose service to evaluate.
 
     :type creator: :class:`.Creator`
+
+    :raises NotFanboxError: If the creator's service is not Fanbox.
     """
 
-    exc_check(creator.service != ServiceType.FANBOX, NotFanboxError(creator.service))
+    if creator.service != ServiceType.FANBOX:
+        raise NotFanboxError(creator.service)
 
 
 def check_if_discord(creator: "Creator") -> None:
@@ -78,6 +71,9 @@ def check_if_discord(creator: "Creator") -> None:
     :param creator: The creator whose service to evaluate.
 
     :type creator: :class:`.Creator`
+
+    :raises NotDiscordError: If the creator's service is not Discord.
     """
 
-    exc_check(creator.service != ServiceType.DISCORD, NotDiscordError(creator.service))
\ No newline at end of file
+    if creator.service != ServiceType.DISCORD:
+        raise NotDiscordError(creator.service)
\ No newline at end of file
@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from .._aux import parse_date
 from .comments_rev import CommentRevision
 
 if TYPE_CHECKING:
@@ -17,7 +18,7 @@ DEFAULT_COMMENT_DATE_FMT: str = r"%Y-%m-%dT%H:%M:%S"
 "The default date formatting to use for comments."
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, repr=False)
 class Comment:
     """
     Comment of a post.
@@ -54,6 +55,8 @@ class Comment:
     commenter: "Creator" = field(repr=False)
     post: "Post" = field(repr=False)
 
+    _url: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
 
     @classmethod
     def from_dict(cls, **fields) -> "Comment":
@@ -70,13 +73,23 @@ class Comment:
             commenter_id=fields.get("commenter"),
             commenter_name=fields.get("commenter_name"),
             content=fields.get("content", ""),
-            published=datetime.strptime(fields.get("published"), DEFAULT_COMMENT_DATE_FMT),
-            revisions=[CommentRevision.from_dict(**rev) for rev in fields.get("revisions")],
+            published=parse_date(fields.get("published")),
+            revisions=[CommentRevision.from_dict(**rev) for rev in fields.get("revisions", ())],
             commenter=fields.get("creator"),
             post=fields.get("post")
         )
 
 
+    def __repr__(self) -> str:
+        """
+        :return: A representation of a :class:`.Comment` class as-is.
+        :rtype: :class:`str`
+        """
+
+        return (f"Comment(id={self.id!r}, parent_id={self.parent_id!r}, "
+                f"commenter_id={self.commenter_id!r}, commenter_name={self.commenter_name!r})")
+
+
     @property
     def url(self) -> "UrlLike":
         """
@@ -84,4 +97,7 @@ class Comment:
         :rtype: :type:`.UrlLike`
         """
 
-        return f"{self.post.url}#{self.id}"
+        if self._url is None:
+            self._url = f"{self.post.url}#{self.id}"
+
+        return self._url
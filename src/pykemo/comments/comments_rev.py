@@ -5,11 +5,13 @@ Comment revisions module.
 from dataclasses import dataclass
 from datetime import datetime
 
+from .._aux import parse_date
+
 DEFAULT_REV_DATE_FMT: str = r"%Y-%m-%dT%H:%M:%S.%f"
 "The default date formatting to use for comment revisions."
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CommentRevision:
     """
     A comment revision.
@@ -42,5 +44,5 @@ class CommentRevision:
         return cls(
             id=fields.get("id"),
             content=fields.get("content", ""),
-            added=datetime.strptime(fields.get("added"), DEFAULT_REV_DATE_FMT)
+            added=parse_date(fields.get("added"))
         )
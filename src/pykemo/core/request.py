@@ -1,13 +1,23 @@
 """
 Custom Requests module.
 """
-from typing import TYPE_CHECKING, Optional, TypeAlias
+from contextlib import closing
+from itertools import takewhile
+from random import uniform
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, TypeAlias
+from urllib.parse import urlencode
 
-from grequests import map as async_map
+from grequests import Pool
 from grequests import request as async_req
 from requests import Session
 from requests.adapters import HTTPAdapter, Retry
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from .._aux.aux_classes import LRUCache
 from ._request_types import HTTPRequestType
 from .urltypes import UrlType
 
@@ -28,16 +38,208 @@ MAX_RETRIES: int = 10
 BACKOFF_FACTOR: float = 0.1
 "The backoff factor for calculating delays."
 
-FORCELIST: list[int] = [429]
+BACKOFF_MAX: float = 15.0
+"""
+The longest backoff `(in seconds)` between retries. Since the delays are random, the actual wait
+is anywhere between zero and this cap, so ``15`` seconds waits about ``7.5`` on average once
+the cap is reached. A ``Retry-After`` header sent along a ``429`` or ``503`` response is not
+capped: that exact delay is waited instead.
+"""
+
+FORCELIST: list[int] = [429, 502, 503, 504]
 "A list of statues codes to be wary of. These will trigger a retry."
 
 ADAPTER_PREFIX: UrlLike = "https://"
 "A prefix for URLs that trigger the custom HTTP adapter."
 
+POOL_CONNECTIONS: int = 32
+"""
+Max number of hosts to keep a connection pool for. Files are spread through several
+DATA servers, and each of them is a different host.
+"""
+
+POOL_MAXSIZE: int = 50
+"""
+Max number of connections to keep alive per host. Should be at least as big as the
+number of concurrent requests that share the session.
+"""
+
+ASYNC_MAP_SIZE: int = POOL_MAXSIZE
+"""
+Default number of requests :func:`imap` keeps in flight at the same time.
+"""
+
+
+class JitterRetry(Retry):
+    """
+    A retry policy with exponential backoff and `full jitter`: instead of waiting exactly
+    ``backoff_factor * 2 ** n`` seconds, it waits a random time between zero and that.
+    This way, concurrent requests that failed together don't retry all at the same time
+    again. A ``Retry-After`` header sent by the server still takes precedence, and it is waited
+    as-is, without jitter nor cap.
+
+    .. note:: ``backoff_max`` requires ``urllib3>=2``.
+    """
+
+    def get_backoff_time(self) -> float:
+        """
+        :return: How long to wait `(in seconds)` before the next retry.
+        :rtype: :class:`float`
+        """
+
+        consecutive_errors = sum(1 for _ in takewhile(lambda error: error.redirect_location is None,
+                                                      reversed(self.history)))
+        if consecutive_errors <= 1:
+            return 0
+
+        backoff = self.backoff_factor * (2 ** (consecutive_errors - 1))
+        return uniform(0, min(self.backoff_max, backoff))
+
+
+def _new_adapter(pool_maxsize: int=POOL_MAXSIZE) -> HTTPAdapter:
+    """
+    .. warning:: `(for internal purposes)`
+    Creates the custom HTTP adapter, with its retry policy.
+
+    :param pool_maxsize: Max number of connections to keep alive per host.
+
+    :type pool_maxsize: :class:`int`
+
+    :return: A new adapter.
+    :rtype: :class:`requests.adapters.HTTPAdapter`
+    """
+
+    return HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                       pool_maxsize=pool_maxsize,
+                       max_retries=JitterRetry(total=MAX_RETRIES,
+                                               backoff_factor=BACKOFF_FACTOR,
+                                               backoff_max=BACKOFF_MAX,
+                                               status_forcelist=FORCELIST,
+                                               respect_retry_after_header=True))
+
+
+def _new_session() -> Session:
+    """
+    .. warning:: `(for internal purposes)`
+    Creates a session with the custom HTTP adapter already mounted.
+
+    :return: A new session.
+    :rtype: `Session <https://requests.readthedocs.io/en/latest/api/#requests.Session>`_
+    """
+
+    session = Session()
+    session.mount(ADAPTER_PREFIX, _new_adapter())
+    return session
+
+
+_SESSION: Session = _new_session()
+"""
+The session shared by all requests, synchronous or not. Keeping it alive allows for the
+connections to be reused instead of doing a new handshake each time. Sharing it between
+concurrent requests is safe, as each of them checks out its own connection from the pool.
+"""
+
+TAGGED_BODY_MAX_BYTES: int = 1024 * 1024
+"""
+Bodies bigger than this `(in bytes)`, like the list of every creator, are not remembered for
+revalidation, so that they don't stay in memory for as long as the process lives.
+"""
+
+TAGGED_BODIES_MAXSIZE: int = 256
+"Max number of bodies to remember for revalidation."
+
+_TAGGED_BODIES: LRUCache = LRUCache(TAGGED_BODIES_MAXSIZE)
+"""
+The last body received from each URL whose response had an ETag, along with said tag.
+A URL with query parameters has them in its key, sorted, so different queries never share a body.
+"""
+
+
+def _tag_key(url: str, params: Any) -> Optional[str]:
+    """
+    .. warning:: `(for internal purposes)`
+    Builds the key under which the body of a URL is tagged, taking its query parameters into
+    account.
+
+    :param url: The full URL requested.
+    :param params: The query parameters sent with it, if any.
+
+    :type url: :class:`str`
+    :type params: :class:`Any`
+
+    :return: The key, or ``None`` if the parameters are not a dict and can't be keyed reliably.
+    :rtype: Optional[:class:`str`]
+    """
+
+    if not params:
+        return url
+
+    if not isinstance(params, dict):
+        return None
+
+    return f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+
+
+def json_body(response: "Response") -> Any:
+    """
+    Decodes the JSON body of a response. If `orjson <https://pypi.org/project/orjson/>`_ is
+    installed it is used instead of the standard library, which is several times faster.
+
+    :param response: The response whose body to decode.
+
+    :type response: `Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_
+
+    :return: The decoded body. Usually a ``list`` or a ``dict``.
+    :rtype: :class:`Any`
+    """
+
+    return json_loads(response.content)
+
+
+def clear_json_cache() -> None:
+    """
+    Forgets every body remembered by :func:`get_json`, so that the next requests are not
+    conditional and the memory they took is released.
+    """
+
+    _TAGGED_BODIES.clear()
+
+
+def close_session() -> None:
+    """
+    Closes all the connections kept alive by the shared session. Useful before shutting down,
+    or after a long burst of requests that won't be followed by others any time soon.
+
+    .. note:: The session can still be used afterwards; it simply connects again.
+    """
+
+    _SESSION.close()
+
+
+def configure_pool(size: int) -> None:
+    """
+    Resizes the connection pools of the shared session, so that `size` requests to the same
+    host can be kept alive at the same time. Meant for calling :func:`map` or :func:`imap`
+    with a `size` bigger than :attr:`POOL_MAXSIZE`; otherwise, the connections past the
+    pool size are closed after each request instead of being reused.
+
+    .. note:: The connections currently kept alive are closed.
+
+    :param size: Max number of connections to keep alive per host.
+
+    :type size: :class:`int`
+    """
+
+    old_adapter = _SESSION.adapters.get(ADAPTER_PREFIX, None)
+    _SESSION.mount(ADAPTER_PREFIX, _new_adapter(size))
+
+    if old_adapter is not None:
+        old_adapter.close()
+
 
 def request(method: str, endpoint: UrlLike, url_type: UrlType=UrlType.API, **kwargs) -> "Response":
     """
-    A customized wrap for `requests.Session.request() <https://requests.readthedocs.io/en/latest/api/#requests.Session.request>_`, with static url and its own session.
+    A customized wrap for `requests.Session.request() <https://requests.readthedocs.io/en/latest/api/#requests.Session.request>_`, with static url and a shared session.
 
     :param method: The HTTP method to use.
     :param endpoint: The endpoint to map to.
@@ -51,17 +253,12 @@ def request(method: str, endpoint: UrlLike, url_type: UrlType=UrlType.API, **kwa
     :rtype: `Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_
     """
 
-    with Session() as session:
-        session.mount(ADAPTER_PREFIX, HTTPAdapter(max_retries=Retry(total=MAX_RETRIES,
-                                                                    backoff_factor=BACKOFF_FACTOR,
-                                                                    status_forcelist=FORCELIST)))
-        res = session.request(method=method, url=f"{url_type}{endpoint}", **kwargs)
-    return res
+    return _SESSION.request(method=method, url=url_type + endpoint, **kwargs)
 
 
 def async_request(method: str, endpoint: UrlLike, url_type: UrlType=UrlType.API, **kwargs) -> "AsyncRequest":
     """
-    A customized wrapper for grequests' :meth:`request()` with its own session. Note that this does not
+    A customized wrapper for grequests' :meth:`request()` with a shared session. Note that this does not
     return a response, but rather an unsent asynchronous request.
 
     :param method: The HTTP method to use.
@@ -76,11 +273,7 @@ def async_request(method: str, endpoint: UrlLike, url_type: UrlType=UrlType.API,
     :rtype: :class:`grequests.AsyncRequest`
     """
 
-    retry_session = Session()
-    retry_session.mount(ADAPTER_PREFIX, HTTPAdapter(max_retries=Retry(total=MAX_RETRIES,
-                                                                      backoff_factor=BACKOFF_FACTOR,
-                                                                      status_forcelist=FORCELIST)))
-    return async_req(method=method, url=f"{url_type}{endpoint}", session=retry_session, **kwargs)
+    return async_req(method=method, url=url_type + endpoint, session=_SESSION, **kwargs)
 
 
 def get(endpoint: UrlLike, params=None, url_type: UrlType=UrlType.API, **kwargs) -> "Response":
@@ -102,6 +295,42 @@ def get(endpoint: UrlLike, params=None, url_type: UrlType=UrlType.API, **kwargs)
     return request(HTTPRequestType.GET, endpoint, params=params, url_type=url_type, **kwargs)
 
 
+def get_json(endpoint: UrlLike, url_type: UrlType=UrlType.API, **kwargs) -> Any:
+    """
+    Gets the JSON body of an endpoint. If the server tagged a previous response of this same URL
+    with an ``ETag``, the request is made conditional, so an unchanged body is not sent again.
+    Only bodies up to :attr:`TAGGED_BODY_MAX_BYTES` are remembered for this.
+    The result is always decoded anew, so it may be freely modified.
+
+    :param endpoint: The endpoint to map to.
+    :param url_type: The root URL to use.
+
+    :type endpoint: :type:`.UrlLike`
+    :type url_type: Optional[:class:`.UrlType`]
+
+    :return: The decoded body. Usually a ``list`` or a ``dict``.
+    :rtype: :class:`Any`
+    """
+
+    url = url_type + endpoint
+    key = _tag_key(url, kwargs.get("params", None))
+    tagged = (_TAGGED_BODIES.get(key) if key is not None else None)
+    if tagged is not None:
+        kwargs["headers"] = {**(kwargs.get("headers", None) or {}), "If-None-Match": tagged[0]}
+
+    response = _SESSION.request(method=HTTPRequestType.GET, url=url, **kwargs)
+
+    if response.status_code == 304 and tagged is not None:
+        return json_loads(tagged[1])
+
+    etag = response.headers.get("etag", None)
+    if (key is not None and etag is not None and response.ok
+            and len(response.content) <= TAGGED_BODY_MAX_BYTES):
+        _TAGGED_BODIES.put(key, (etag, response.content))
+
+    return json_body(response)
+
+
 def options(endpoint: UrlLike, url_type: UrlType=UrlType.API, **kwargs) -> "Response":
     """
     A wrap for `requests.options() <https://requests.readthedocs.io/projects/requests-html/en/latest/index.html#requests_html.HTMLSession.options>`_.
@@ -233,28 +462,126 @@ def async_get(endpoint: UrlLike, params=None, url_type: UrlType=UrlType.API, **k
     return async_request(HTTPRequestType.GET, endpoint, params=params, url_type=url_type, **kwargs)
 
 
-def map(endpoints: list[UrlLike],
+def map(endpoints: Iterable[UrlLike],
         url_type: UrlType=UrlType.API,
         size: Optional[int]=None,
-        **kwargs) -> list["Response"]:
+        **kwargs) -> list[Optional["Response"]]:
     """
-    A wrapper for grequests' :meth:`map()`. 
+    Requests all the endpoints concurrently and collects their responses.
+    To process each response as soon as it arrives instead, use :func:`imap`.
 
     .. note:: This one accepts `endpoints as strings`, not already created unsent requests.
 
-    :param endpoints: A list of all the endpoints to process.
+    :param endpoints: All the endpoints to process.
     :param url_type: The root URL to use.
-    :param size: How big is each batch of asynchronous requests.
+    :param size: How many requests can be waiting for a response at the same time.
+                 If ``None``, all of them are sent at once.
 
-    :type endpoints: list[:type:`.UrlLike`]
+    :type endpoints: Iterable[:type:`.UrlLike`]
     :type url_type: Optional[:class:`.UrlType`]
     :type size: Optional[:class:`int`]
 
-    :return: The list of completed responses.
-    :rtype: list[`Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_]
+    :return: The list of completed responses, in the same order as the endpoints. A failed
+             request is ``None`` instead.
+    :rtype: list[Optional[`Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_]]
     """
 
     req_endpoints = (async_get(endpoint, url_type=url_type, **kwargs)
                      for endpoint in endpoints)
-    
-    return async_map(req_endpoints, size=size, **kwargs)
+
+    return [req.response for req in send_streamed(req_endpoints, size)]
+
+
+def send_streamed(requests: Iterable["AsyncRequest"], size: Optional[int]) -> Iterator["AsyncRequest"]:
+    """
+    Sends the requests with at most `size` of them in flight at any given time, yielding them
+    once sent, in the same order as given. These are only consumed as needed, so the iterable
+    may very well be endless; once this generator is closed, nothing else is sent.
+
+    :param requests: The requests to send.
+    :param size: How many requests can be waiting for a response at the same time.
+                 If ``None``, there is no such limit.
+
+    :type requests: Iterable[:class:`grequests.AsyncRequest`]
+    :type size: Optional[:class:`int`]
+
+    :return: A generator of the sent requests, with either their response or their exception.
+    :rtype: Iterator[:class:`grequests.AsyncRequest`]
+    """
+
+    pool = Pool(size)
+    sent = pool.imap(lambda req: req.send(), requests, maxsize=size)
+
+    try:
+        yield from sent
+    finally:
+        sent.kill()
+        pool.kill()
+
+
+def imap(endpoints: Iterable[UrlLike],
+         url_type: UrlType=UrlType.API,
+         size: int=ASYNC_MAP_SIZE,
+         exception_handler: Optional[Callable[["AsyncRequest", Exception], Any]]=None,
+         **kwargs) -> Iterator[Any]:
+    """
+    Like :func:`map`, but yields each response as soon as it and the ones before it arrive,
+    instead of holding all of them until the last one does. This way, the responses can be
+    processed and discarded while the rest are still being requested. Unlike :func:`map`,
+    a failed request raises its exception, just like a synchronous request would, unless an
+    `exception_handler` is given.
+
+    :param endpoints: All the endpoints to process.
+    :param url_type: The root URL to use.
+    :param size: How many requests can be waiting for a response at the same time.
+    :param exception_handler: If given, it is called with a failed request and its exception,
+                              and whatever it returns is yielded in place of the response.
+
+    :type endpoints: Iterable[:type:`.UrlLike`]
+    :type url_type: Optional[:class:`.UrlType`]
+    :type size: :class:`int`
+    :type exception_handler: Optional[Callable[[:class:`grequests.AsyncRequest`, :class:`Exception`], :class:`Any`]]
+
+    :raises Exception: The exception a request failed with, if any and not handled.
+
+    :return: A generator of the responses, in the same order as the endpoints.
+    :rtype: Iterator[`Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_]
+    """
+
+    req_endpoints = (async_get(endpoint, url_type=url_type, **kwargs)
+                     for endpoint in endpoints)
+
+    return imap_requests(req_endpoints, size=size, exception_handler=exception_handler)
+
+
+def imap_requests(requests: Iterable["AsyncRequest"],
+                  size: Optional[int]=ASYNC_MAP_SIZE,
+                  exception_handler: Optional[Callable[["AsyncRequest", Exception], Any]]=None) -> Iterator[Any]:
+    """
+    Like :func:`imap`, but for already created unsent requests. As with :func:`send_streamed`,
+    the iterable may very well be endless; once this generator is closed, nothing else is sent.
+
+    :param requests: The requests to send.
+    :param size: How many requests can be waiting for a response at the same time.
+                 If ``None``, there is no such limit.
+    :param exception_handler: If given, it is called with a failed request and its exception,
+                              and whatever it returns is yielded in place of the response.
+
+    :type requests: Iterable[:class:`grequests.AsyncRequest`]
+    :type size: Optional[:class:`int`]
+    :type exception_handler: Optional[Callable[[:class:`grequests.AsyncRequest`, :class:`Exception`], :class:`Any`]]
+
+    :raises Exception: The exception a request failed with, if any and not handled.
+
+    :return: A generator of the responses, in the same order as the requests.
+    :rtype: Iterator[`Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_]
+    """
+
+    with closing(send_streamed(requests, size)) as sent:
+        for req in sent:
+            if req.response is not None:
+                yield req.response
+            elif exception_handler is not None:
+                yield exception_handler(req, req.exception)
+            else:
+                raise req.exception
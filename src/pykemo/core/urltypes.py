@@ -3,6 +3,16 @@ URL types module.
 """
 
 from enum import StrEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..services import ServiceLike
+
+USER_ENDPOINT: str = "/%s/user/%s%s"
+"""
+Template for the endpoints under a creator. It is filled with the service, the ID of the
+creator, and an optional suffix, in that order.
+"""
 
 
 class UrlType(StrEnum):
@@ -16,3 +26,22 @@ class UrlType(StrEnum):
     DATA = "https://c{i}.kemono.su"
     API = "https://kemono.su/api/v1"
     DISCORD = "https://cdn.discordapp.com" # Specifically for Discord assets
+
+
+def user_endpoint(service: "ServiceLike", creator_id: str, suffix: str="") -> str:
+    """
+    Builds an endpoint under a creator, like ``/fanbox/user/1234/links``.
+
+    :param service: The service of the creator.
+    :param creator_id: The ID of the creator.
+    :param suffix: What to append after the creator's endpoint. Should start with ``'/'``.
+
+    :type service: :type:`.ServiceLike`
+    :type creator_id: :class:`str`
+    :type suffix: :class:`str`
+
+    :return: The endpoint, relative to the root URL.
+    :rtype: :class:`str`
+    """
+
+    return USER_ENDPOINT % (service, creator_id, suffix)
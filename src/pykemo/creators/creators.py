@@ -2,22 +2,25 @@
 Creators module.
 """
 
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal, Optional, TypeAlias, Union
+from typing import TYPE_CHECKING, Iterable, Literal, Optional, TypeAlias, Union
 
 from .._aux import (
+    DEFAULT_BATCH_SEND_SIZE,
+    LRUCache,
     async_get_posts_responses,
-    before_date,
+    date_filter,
     get_posts_responses,
-    since_date,
+    parse_date,
 )
 from ..announcements import Announcement
-from ..core import UrlType, get
+from ..core import UrlType, get, get_json, imap, json_body, user_endpoint
 from ..discord import ChannelsList, DiscordChannel
 from ..fanbox import Fancard
-from ..posts import DEFAULT_DATE_FMT, ELEMENTS_PER_PAGE, Post, PostsList
-from ..services import ServiceType
+from ..posts import ELEMENTS_PER_PAGE, Post, PostsList
+from ..services import ServiceType, to_service
 
 if TYPE_CHECKING:
     from requests import Response
@@ -29,11 +32,29 @@ CreatorsList: TypeAlias = list["Creator"]
 _CreatorFields: TypeAlias = Literal["id", "name", "service", "indexed", "updated",
                                     "public_id", "favorited"]
 CreatorDict: TypeAlias = dict[_CreatorFields, Union[str, int, None]]
+CreatorKey: TypeAlias = tuple["ServiceLike", str]
 AnnouncementsList: TypeAlias = list[Announcement]
 FancardsList: TypeAlias = list[Fancard]
 
+PROFILES_CACHE_MAXSIZE: int = 4096
+"Max number of creator profiles to remember."
 
-@dataclass(kw_only=True)
+_PROFILES: LRUCache = LRUCache(PROFILES_CACHE_MAXSIZE)
+"""
+The fields of the last profiles received, by the service and ID of their creator.
+"""
+
+
+def clear_profile_cache() -> None:
+    """
+    Forgets every creator profile received so far, so that the next time any of them is
+    needed it is requested again, with its current favorites and dates.
+    """
+
+    _PROFILES.clear()
+
+
+@dataclass(kw_only=True, slots=True, repr=False)
 class Creator:
     """
     Container class for a creator. Mainly initialized when using helper functions like
@@ -72,8 +93,11 @@ class Creator:
     __fanc_loaded: bool = field(default=False, init=False, repr=False)
 
     _channels: ChannelsList = field(default_factory=list, init=False, repr=False)
+    _channels_by_id: dict[str, DiscordChannel] = field(default_factory=dict, init=False, repr=False)
     __chan_loaded: bool = field(default=False, init=False, repr=False)
 
+    _url: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
 
     @classmethod
     def from_dict(cls, **fields: CreatorDict) -> "Creator":
@@ -84,40 +108,160 @@ class Creator:
         :rtype: :class:`Creator`
         """
 
-        date_fmt = rf"{DEFAULT_DATE_FMT}.%f"
-
         return cls(
             id=fields.get("id", None) or fields.get("user"),
             name=fields.get("name", None),
-            service=ServiceType(fields.get("service")),
-            indexed=datetime.strptime(fields.get("indexed"), date_fmt),
-            updated=datetime.strptime(fields.get("updated"), date_fmt),
+            service=to_service(fields.get("service")),
+            indexed=parse_date(fields.get("indexed")),
+            updated=parse_date(fields.get("updated")),
             public_id=fields.get("public_id", None),
             favorited=fields.get("favorited", None)
         )
 
 
+    def __repr__(self) -> str:
+        """
+        :return: A representation of a :class:`.Creator` class as-is.
+        :rtype: :class:`str`
+        """
+
+        return f"Creator(id={self.id!r}, name={self.name!r}, service={self.service!r})"
+
+
     @classmethod
-    def from_profile(cls, service: "ServiceLike", creator_id: str) -> Optional["Creator"]:
+    def from_profile(cls,
+                     service: "ServiceLike",
+                     creator_id: str,
+                     use_cache: bool=True) -> Optional["Creator"]:
         """
         Retrieves a creator using its profile info.
 
+        .. note:: Profiles already received are remembered and not requested again, so their
+                  favorites and dates may be outdated. Use ``use_cache=False`` to get the
+                  current ones, or :func:`clear_profile_cache` to forget all of them.
+
         :param service: The service of the creator.
         :param creator_id: The ID of the creator.
+        :param use_cache: Wether a profile already received may be used instead of requesting it.
 
         :type service: :type:`ServiceLike`
         :type creator_id: :class:`str`
+        :type use_cache: :class:`bool`
 
         :return: If the creator is found, retrieve and create a :class:`Creator` instance, otherwise return ``None``.
         :rtype: Optional[:class:`Creator`]
         """
 
-        creator_response = get(f"/{service}/user/{creator_id}/profile")
+        creator = (cls._from_cached_profile(service, creator_id) if use_cache else None)
+        if creator is not None:
+            return creator
+
+        return cls.from_profile_response(get(cls.profile_endpoint(service, creator_id)))
+
+
+    @classmethod
+    def _from_cached_profile(cls, service: "ServiceLike", creator_id: str) -> Optional["Creator"]:
+        """
+        .. warning:: `(for internal purposes)`
+        Creates a creator from a profile that was already received before, without
+        making any request.
 
-        if creator_response.status_code == 404:
+        :param service: The service of the creator.
+        :param creator_id: The ID of the creator.
+
+        :type service: :type:`ServiceLike`
+        :type creator_id: :class:`str`
+
+        :return: A :class:`Creator` instance if its profile is remembered, otherwise ``None``.
+        :rtype: Optional[:class:`Creator`]
+        """
+
+        key = (service, creator_id)
+        fields = _PROFILES.get(key)
+        if fields is None:
+            return None
+
+        return cls.from_dict(**fields)
+
+
+    @classmethod
+    def from_profile_response(cls, response: "Response") -> Optional["Creator"]:
+        """
+        Creates a creator from an already made request to its profile.
+
+        :param response: The response of the profile request.
+
+        :type response: `Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_
+
+        :return: If the creator was found, a :class:`Creator` instance, otherwise ``None``.
+        :rtype: Optional[:class:`Creator`]
+        """
+
+        if response.status_code == 404:
             return None
 
-        return Creator.from_dict(**creator_response.json())
+        fields = json_body(response)
+        key = (fields.get("service"), fields.get("id", None) or fields.get("user"))
+        _PROFILES.put(key, fields)
+
+        return cls.from_dict(**fields)
+
+
+    @classmethod
+    def from_profiles(cls,
+                      keys: Iterable[CreatorKey],
+                      use_cache: bool=True) -> dict[CreatorKey, Optional["Creator"]]:
+        """
+        Requests the profiles of many creators concurrently, :attr:`.DEFAULT_BATCH_SEND_SIZE` at
+        a time, each of them only once, no matter how many times it is repeated in `keys`.
+        Unless `use_cache` is ``False``, profiles that were already received are not requested,
+        so they may be outdated.
+
+        :param keys: The service and ID of each creator.
+        :param use_cache: Wether profiles already received may be used instead of requesting them.
+
+        :type keys: Iterable[:type:`CreatorKey`]
+        :type use_cache: :class:`bool`
+
+        :raises Exception: The exception a profile request failed with, if any.
+
+        :return: The creators by their service and ID. Those not found map to ``None``.
+        :rtype: dict[:type:`CreatorKey`, Optional[:class:`Creator`]]
+        """
+
+        creators = {}
+        missing_keys = []
+
+        for key in dict.fromkeys(keys):
+            creator = (cls._from_cached_profile(*key) if use_cache else None)
+            if creator is None:
+                missing_keys.append(key)
+            else:
+                creators[key] = creator
+
+        endpoints = [cls.profile_endpoint(service, creator_id)
+                     for service, creator_id in missing_keys]
+        with closing(imap(endpoints, size=DEFAULT_BATCH_SEND_SIZE)) as responses:
+            creators.update((key, cls.from_profile_response(response))
+                            for key, response in zip(missing_keys, responses))
+
+        return creators
+
+
+    @staticmethod
+    def profile_endpoint(service: "ServiceLike", creator_id: str) -> "UrlLike":
+        """
+        :param service: The service of the creator.
+        :param creator_id: The ID of the creator.
+
+        :type service: :type:`ServiceLike`
+        :type creator_id: :class:`str`
+
+        :return: The endpoint of the creator's profile.
+        :rtype: :type:`.UrlLike`
+        """
+
+        return user_endpoint(service, creator_id, "/profile")
 
 
     @property
@@ -167,9 +311,7 @@ class Creator:
         :rtype: list[:class:`.DiscordChannel`]
         """
 
-        if not self.__chan_loaded:
-            self.__chan_loaded = True
-            self._channels = self.fetch_channels()
+        self._load_channels()
 
         return self._channels
 
@@ -181,27 +323,30 @@ class Creator:
         :rtype: :type:`.UrlLike`
         """
 
-        return f"{UrlType.SITE}/{self.service}/user/{self.id}"
+        if self._url is None:
+            self._url = UrlType.SITE + user_endpoint(self.service, self.id)
+
+        return self._url
 
 
     def other_links(self) -> list["Creator"]:
         """
         Searches for other accounts of this creator.
 
+        The profiles of the other accounts are requested concurrently, unless already received.
+        Accounts whose profile is not found are left out.
+
+        :raises Exception: The exception a profile request failed with, if any.
+
         :returns: Other instances of :class:`.Creator` associated to this one, if any.
         :rtype: list[:class:`.Creator`]
         """
 
-        link_response = get(f"/{self.service}/user/{self.id}/links")
-        links = []
+        links_fields = get_json(user_endpoint(self.service, self.id, "/links"))
+        links = self.from_profiles((link_fields.get("service"), link_fields.get("id"))
+                                   for link_fields in links_fields)
 
-        for link_fields in link_response.json():
-            creator = Creator.from_profile(link_fields.get("service"),
-                                           link_fields.get("id"))
-            if creator is not None:
-                links.append(creator)
-
-        return links
+        return [creator for creator in links.values() if creator is not None]
 
 
     def posts(self,
@@ -210,7 +355,8 @@ class Creator:
               max_posts: Optional[int]=ELEMENTS_PER_PAGE,
               before: Optional[datetime]=None,
               since: Optional[datetime]=None,
-              asynchronous: bool=False) -> PostsList:
+              asynchronous: bool=False,
+              batch_send_size: Optional[int]=None) -> PostsList:
         """
         Retrieves posts under this creator. If the creator is from Discord, it won't retrieve any,
         as that service doesn't use 'posts'.
@@ -218,14 +364,16 @@ class Creator:
         :param query: The string to search for specific posts.
         :param max_posts: The max number of posts to look through. This is NOT necessarily the number of posts to enter the lists. If `None`, it will try to retrieve ALL the posts.
         :param before: Include only posts before this date.
-        :param since: Include only posts after and including this date.
+        :param since: Include only posts after and including this date. Unless there's a `query`, the posts are expected to come newest first, as the API sends them, so no more pages are requested once a whole page worth of them in a row is older than this.
         :param asynchronous: Wether to use asynchronous requests to maybe boost performance. It's really only recommended with queries of no more than 350 posts. Too many queries overwhelms the server and it actually slows the request down.
+        :param batch_send_size: How many pages to request at the same time. When asynchronous, new pages are requested as soon as others arrive, and it defaults to :attr:`.DEFAULT_BATCH_SEND_SIZE`. Otherwise, each batch is only requested once the last one arrived whole, and it defaults to :attr:`.PAGES_WINDOW`.
 
         :type query: Optional[:class:`str`]
         :type max_posts: Optional[:class:`int`]
         :type before: Optional[:class:`datetime.datetime`]
         :type since: Optional[:class:`datetime.datetime`]
         :type asynchronous: :class:`bool`
+        :type batch_send_size: Optional[:class:`int`]
 
         :raises ValueError: If ``max_posts`` is negative or zero.
 
@@ -237,22 +385,29 @@ class Creator:
             raise ValueError(f"max_posts must be an integer greater than zero, not '{max_posts}'")
 
         posts_req = (async_get_posts_responses if asynchronous else get_posts_responses)
-        response_bodies = posts_req(endpoint=f"/{self.service}/user/{self.id}",
+        response_bodies = posts_req(endpoint=user_endpoint(self.service, self.id),
                                     query=query,
                                     max_posts=max_posts,
-                                    page_stepping=ELEMENTS_PER_PAGE)
+                                    page_stepping=ELEMENTS_PER_PAGE,
+                                    batch_send_size=batch_send_size)
+        # without a query the posts come newest first, so no more pages are needed once a
+        # whole page worth of them is older than `since`; a few out of order don't stop it
+        stop_early = (since is not None and query is None)
+        in_bounds = date_filter(before, since)
+        older_in_a_row = 0
         posts_list = []
 
-        for post_fields in response_bodies:
-            published_str = post_fields["published"]
-            if ((before is not None and not before_date(published_str, before)) or
-                (since is not None and not since_date(published_str, since))):
-                continue
-
-            post_fields.update(creator=self)
-            post = Post.from_dict(**post_fields)
+        with closing(response_bodies):
+            for post_fields in response_bodies:
+                published, keep = in_bounds(post_fields["published"])
+                if stop_early:
+                    older_in_a_row = (older_in_a_row + 1 if published < since else 0)
+                    if older_in_a_row >= ELEMENTS_PER_PAGE:
+                        break
 
-            posts_list.append(post)
+                if keep: # the date is already parsed, so it's passed as-is
+                    posts_list.append(Post.from_dict(**(post_fields | {"creator": self,
+                                                                       "published": published})))
 
         return posts_list
 
@@ -269,12 +424,12 @@ class Creator:
         :rtype: Optional[`.Post`]
         """
 
-        response = get(f"/{self.service}/user/{self.id}/post/{post_id}")
+        response = get(user_endpoint(self.service, self.id, f"/post/{post_id}"))
 
         if response.status_code == 404:
             return None
 
-        return Post.from_dict(**response.json())
+        return Post.from_dict(**json_body(response))
 
 
     def _fetch_announcements(self) -> AnnouncementsList:
@@ -287,12 +442,10 @@ class Creator:
         :rtype: list[:class:`.Announcement`]
         """
 
-        response = get(f"/{self.service}/user/{self.id}/announcements")
         announcements = []
 
-        for ann_fields in response.json():
-            ann_fields.update(creator=self)
-            announcements.append(Announcement.from_dict(**ann_fields))
+        for ann_fields in get_json(user_endpoint(self.service, self.id, "/announcements")):
+            announcements.append(Announcement.from_dict(creator=self, **ann_fields))
 
         return announcements
 
@@ -311,25 +464,34 @@ class Creator:
         fancards = []
 
         if self.service == ServiceType.FANBOX:
-            response = get(f"/{self.service}/user/{self.id}/fancards")
-
-            for fancard_fields in response.json():
-                fancard_fields.update(creator=self)
-                fancards.append(Fancard.from_dict(**fancard_fields))
+            for fancard_fields in get_json(user_endpoint(self.service, self.id, "/fancards")):
+                fancards.append(Fancard.from_dict(creator=self, **fancard_fields))
 
         return fancards
 
 
-    def _get_channels_response(self) -> "Response":
+    def _get_channels_fields(self) -> list[dict]:
         """
         .. warning:: `(for internal purposes)`
-        Gets the channels request.
+        Gets the fields of the channels from their lookup.
 
-        :return: The response of the channels' lookup.
-        :rtype: `Response <https://requests.readthedocs.io/en/latest/api/#requests.Response>`_
+        :return: The fields of each channel.
+        :rtype: list[:class:`dict`]
         """
 
-        return get(f"/discord/channel/lookup/{self.id}")
+        return get_json(f"/discord/channel/lookup/{self.id}")
+
+
+    def _load_channels(self) -> None:
+        """
+        .. warning:: `(for internal purposes)`
+        Fetches the channels of the creator, only if not done before.
+        """
+
+        if not self.__chan_loaded:
+            self.__chan_loaded = True
+            self._channels = self.fetch_channels()
+            self._channels_by_id = {channel.id: channel for channel in self._channels}
 
 
     def fetch_channels(self) -> ChannelsList:
@@ -344,9 +506,8 @@ class Creator:
 
         if self.service == ServiceType.DISCORD:
 
-            for chan_fields in self._get_channels_response().json():
-                chan_fields.update(creator=self)
-                channels.append(DiscordChannel.from_dict(**chan_fields))
+            for chan_fields in self._get_channels_fields():
+                channels.append(DiscordChannel.from_dict(creator=self, **chan_fields))
 
 
         return channels
@@ -354,7 +515,10 @@ class Creator:
 
     def get_channel(self, channel_id: str) -> Optional[DiscordChannel]:
         """
-        Fetches a specific channel of this creator by id.
+        Gets a specific channel of this creator by id. The channels are only fetched
+        the first time, same as with :attr:`.channels`.
+
+        .. note:: Only really works if the service is Discord, returns ``None`` if not.
 
         :param channel_id: The ID of the channel to find.
 
@@ -364,9 +528,6 @@ class Creator:
         :rtype: Optional[:class:`.DiscordChannel`]
         """
 
-        for chan_fields in self._get_channels_response().json():
-            if chan_fields.get("id") == channel_id:
-                chan_fields.update(creator=self)
-                return DiscordChannel.from_dict(**chan_fields)
+        self._load_channels()
 
-        return None
\ No newline at end of file
+        return self._channels_by_id.get(channel_id, None)
\ No newline at end of file
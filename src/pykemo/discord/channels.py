@@ -8,10 +8,8 @@ from typing import TYPE_CHECKING, Optional, TypeAlias
 
 from .._aux import (
     async_get_posts_responses,
-    before_date,
+    date_filter,
     get_posts_responses,
-    since_date,
-    MILI_DATE_FMT
 )
 from ..core import UrlType
 from .messages import DiscordMessage, MessagesList
@@ -26,7 +24,7 @@ OFFSET_STEPPING: int = 150
 "Offset stepping enforced by the API when querying Discord channels."
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DiscordChannel:
     """
     A channel that belongs to a Discord server/guild.
@@ -83,7 +81,7 @@ class DiscordChannel:
         :rtype: :type:`.urlLike`
         """
 
-        return f"{UrlType.SITE}/discord/server/{self.server_id}#{self.id}"
+        return UrlType.SITE + f"/discord/server/{self.server_id}#{self.id}"
 
 
     def messages(self,
@@ -120,19 +118,15 @@ class DiscordChannel:
         response_bodies = posts_req(endpoint=f"/discord/channel/{self.id}",
                                     max_posts=max_msg,
                                     page_stepping=OFFSET_STEPPING)
+        in_bounds = date_filter(before, since)
         msgs_list = []
 
         for msg_fields in response_bodies:
-            published_str = msg_fields["published"]
-            if ((before is not None and not before_date(published_str, before,
-                                                        fmt1=MILI_DATE_FMT, fmt2=MILI_DATE_FMT)) or
-                (since is not None and not since_date(published_str, since,
-                                                      fmt1=MILI_DATE_FMT, fmt2=MILI_DATE_FMT))):
+            published, keep = in_bounds(msg_fields["published"])
+            if not keep:
                 continue
 
-            msg_fields.update(parent_channel=self)
-            post = DiscordMessage.from_dict(**msg_fields)
-
-            msgs_list.append(post)
+            msg_fields.update(parent_channel=self, published=published)
+            msgs_list.append(DiscordMessage.from_dict(**msg_fields))
 
         return msgs_list
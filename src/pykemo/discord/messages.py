@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, TypeAlias
 
-from .._aux import sanitize_data_url
+from .._aux import parse_date, sanitize_data_url
 from ..files import File, FilesList
 from .users import DiscordUser
 
@@ -18,7 +18,7 @@ MessagesList: TypeAlias = list["DiscordMessage"]
 MSG_DATE_FMT = r"%Y-%m-%dT%H:%M:%S.%f"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DiscordMessage:
     """
     A discord message inside a channel.
@@ -80,14 +80,14 @@ class DiscordMessage:
             server_id=fields.get("server"),
             channel=fields.get("parent_channel"),
             content=fields.get("content", ""),
-            added=(datetime.strptime(added_date, MSG_DATE_FMT) if added_date is not None else None),
-            published=datetime.strptime(fields.get("published"), MSG_DATE_FMT),
-            edited=(datetime.strptime(edited_date, MSG_DATE_FMT)
+            added=(parse_date(added_date) if added_date is not None else None),
+            published=parse_date(fields.get("published")),
+            edited=(parse_date(edited_date)
                     if edited_date is not None else None),
             embeds=fields.get("embeds", []),
             mentions=fields.get("mentions", []),
             attachments=[File.from_dict(**sanitize_data_url(attachment_fields))
-                         for attachment_fields in fields.get("attachments")]
+                         for attachment_fields in fields.get("attachments", ())]
         )
 
 
@@ -9,7 +9,7 @@ from ..core import UrlType
 from ..files import File
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, repr=False)
 class DiscordUser:
     """
     A discord user. Not to be confused with :class:`.Creator`, as they have different properties.
@@ -87,3 +87,13 @@ class DiscordUser:
             flags=fields.get("flags", 0),
             public_flags=fields.get("public_flags", 0)
         )
+
+
+    def __repr__(self) -> str:
+        """
+        :return: A representation of a :class:`.DiscordUser` class as-is.
+        :rtype: :class:`str`
+        """
+
+        return (f"DiscordUser(id={self.id!r}, username={self.username!r}, "
+                f"global_name={self.global_name!r}, discriminator={self.discriminator!r})")
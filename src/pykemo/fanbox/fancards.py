@@ -5,6 +5,8 @@ Fancards module. Exclusive to Fanbox service.
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
+
+from .._aux import parse_date
 from ..files import File
 
 if TYPE_CHECKING:
@@ -13,7 +15,7 @@ if TYPE_CHECKING:
 FANC_DATE_FMT: str = r"%Y-%m-%dT%H:%M:%S.%f"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, repr=False)
 class Fancard:
     """
     A Fancard is an exclusive feature of the Fanbox service, in which each supporter can
@@ -81,7 +83,7 @@ class Fancard:
         file_ext = fields.get("ext")
 
         file_name = f"{creator.name}_{file_id}{file_ext}"
-        file_subpath = f"/{fhash[0:2]}/{fhash[2:4]}/{fhash}{file_ext}"
+        file_subpath = f"/{fhash[:2]}/{fhash[2:4]}/{fhash}{file_ext}"
 
         return cls(
             id=str(fields.get("id")),
@@ -93,8 +95,18 @@ class Fancard:
             price=fields.get("price", ""),
             fhash=fhash,
             ihash=fields.get("ihash", None),
-            last_checked=datetime.strptime(fields.get("last_checked_at"), FANC_DATE_FMT),
-            added=datetime.strptime(fields.get("added"), FANC_DATE_FMT),
-            mtime=datetime.strptime(fields.get("mtime"), FANC_DATE_FMT),
-            ctime=datetime.strptime(fields.get("ctime"), FANC_DATE_FMT)
+            last_checked=parse_date(fields.get("last_checked_at")),
+            added=parse_date(fields.get("added")),
+            mtime=parse_date(fields.get("mtime")),
+            ctime=parse_date(fields.get("ctime"))
         )
+
+
+    def __repr__(self) -> str:
+        """
+        :return: A representation of a :class:`.Fancard` class as-is.
+        :rtype: :class:`str`
+        """
+
+        return (f"Fancard(id={self.id!r}, creator_id={self.creator_id!r}, "
+                f"file_id={self.file_id!r}, file_size={self.file_size!r})")
@@ -2,10 +2,15 @@
 Files module.
 """
 
+from email.utils import formatdate, parsedate_to_datetime
+from os import replace, utime
+from pathlib import Path
+from shutil import SameFileError, copy2, copyfileobj
 from typing import TYPE_CHECKING, Optional, Union, TypeAlias, Literal
+
 from tqdm import tqdm
-from pathlib import Path
 
+from .._aux import LRUCache
 from ..core import UrlType, get
 
 if TYPE_CHECKING:
@@ -21,10 +26,41 @@ BAR_WIDTH: int = 125
 The width of the progress bar in verbose mode.
 """
 
+CHUNK_SIZE: int = 64 * 1024
+"""
+The default size `(in bytes)` of the chunks in which files are downloaded.
+"""
+
+_DATA_ROOTS: dict[int, str] = {}
+"""
+Cache of the root URL of each DATA server, so that it is formatted only once per server.
+"""
+
+SAVED_PATHS_MAXSIZE: int = 1024
+"Max number of saved files to remember."
+
+_SAVED_PATHS: LRUCache = LRUCache(SAVED_PATHS_MAXSIZE)
+"""
+Where the content of each URL was last saved to, along with the size and modification time
+`(in nanoseconds)` it was left with, so that saving it somewhere else again copies that file
+instead of downloading it another time, as long as it was not touched since then.
+"""
+
+
+def clear_saved_files_cache() -> None:
+    """
+    Forgets where every file was saved so far, so that saving any of them again downloads
+    it anew instead of copying it from there.
+    """
+
+    _SAVED_PATHS.clear()
+
 
 class File:
     "A normal file. It may very well be text or a binary type."
 
+    __slots__ = ("_name", "_rel_path", "_content_type", "_size", "_url_root", "_server", "_url")
+
     def __init__(self,
                  name: "PathLike",
                  path: "PathLike",
@@ -54,11 +90,14 @@ class File:
         self._rel_path: "UrlLike" = path
 
         self._content_type: Optional[str] = content_type
+        self._size: Optional[int] = None
         self._url_root: "UrlLike" = url_source
         self._server: int = server
 
         if self._is_data(self._url_root):
-            self._url_root = self._url_root.format(i=self._server)
+            self._url_root = self._data_root(self._server)
+
+        self._url: Optional[str] = None
 
 
 
@@ -112,6 +151,27 @@ class File:
         return url == UrlType.DATA
 
 
+    @staticmethod
+    def _data_root(server: int) -> str:
+        """
+        .. warning:: `(for internal purposes)`
+        Retrieves the root URL of a DATA server, formatting it only the first time.
+
+        :param server: The number of the server.
+
+        :type server: :class:`int`
+
+        :returns: The root URL of said server.
+        :rtype: :class:`str`
+        """
+
+        root = _DATA_ROOTS.get(server, None)
+        if root is None:
+            root = _DATA_ROOTS[server] = UrlType.DATA.format(i=server)
+
+        return root
+
+
     @property
     def name(self) -> "PathLike":
         """
@@ -132,6 +192,16 @@ class File:
         return self._content_type
 
 
+    @property
+    def size(self) -> Optional[int]:
+        """
+        :return: The size `(in bytes)` of the file content. Might be ``None`` if not known yet.
+        :rtype: Optional[:class:`int`]
+        """
+
+        return self._size
+
+
     @property
     def url(self) -> "UrlLike":
         """
@@ -139,30 +209,147 @@ class File:
         :rtype: :type:`.UrlLike`
         """
 
-        return f"{self._url_root}{self._rel_path}"
+        if self._url is None:
+            self._url = self._url_root + self._rel_path
+
+        return self._url
 
 
-    def _is_text_mode(self) -> bool:
+    def _update_headers(self, headers: dict[str, str]) -> None:
         """
-        Parses the MIME content type and tries to detect if the content is a text file.
+        .. warning:: `(for internal purposes)`
+        Keeps the metadata of the file found in the headers of a response, if not known yet.
 
-        :return: ``True`` if the content is not binary, or ``False`` if it is.
+        :param headers: The headers of a response for the file.
+
+        :type headers: :class:`dict`
+        """
+
+        if self._content_type is None:
+            self._content_type = headers.get("content-type", None)
+
+        if self._size is None and "content-length" in headers:
+            self._size = int(headers["content-length"])
+
+
+    @staticmethod
+    def _stamp_last_modified(path: Path, last_modified: Optional[str]) -> None:
+        """
+        .. warning:: `(for internal purposes)`
+        Sets the modification date of a saved file to the one the server reported, so that
+        it can later be asked if it has changed since then.
+
+        :param path: The path of the saved file.
+        :param last_modified: The ``Last-Modified`` header of the response, if any.
+
+        :type path: :class:`Path`
+        :type last_modified: Optional[:class:`str`]
+        """
+
+        if last_modified is None:
+            return
+
+        try:
+            timestamp = parsedate_to_datetime(last_modified).timestamp()
+        except (TypeError, ValueError):
+            return
+
+        utime(path, (timestamp, timestamp))
+
+
+    def _copy_saved(self, path: Path) -> bool:
+        """
+        .. warning:: `(for internal purposes)`
+        Copies the content of this file from where it was already saved, if anywhere else.
+
+        :param path: The path in which to save the file.
+
+        :type path: :class:`Path`
+
+        :return: ``True`` if there was an untouched saved copy to use, ``False`` otherwise.
+        :rtype: :class:`bool`
+        """
+
+        saved = _SAVED_PATHS.get(self.url)
+        if saved is None:
+            return False
+
+        saved_path, saved_size, saved_mtime = saved
+        if saved_path == path:
+            return False
+
+        try:
+            stat = saved_path.stat()
+        except OSError: # it was moved or deleted since then
+            return False
+
+        if stat.st_size != saved_size or stat.st_mtime_ns != saved_mtime: # changed since then
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            copy2(saved_path, path) # keeps the modification date the server gave it
+        except SameFileError: # the same path, only written differently
+            return False
+
+        return True
+
+
+    def _is_intact(self, path: Path) -> bool:
+        """
+        .. warning:: `(for internal purposes)`
+        Checks if the file found in a path is still the one saved there, so that its
+        modification date can be trusted to ask the server if it has changed.
+
+        :param path: The path of the file found.
+
+        :type path: :class:`Path`
+
+        :return: ``True`` if its size `(and modification time, if it was saved by this process)`
+                 is the expected one, ``False`` if it can't be known or it was changed since then.
         :rtype: :class:`bool`
         """
 
-        return self.content_type is not None and self.content_type.startswith("text")
+        stat = path.stat()
+        saved = _SAVED_PATHS.get(self.url)
+        if saved is not None and saved[0] == path:
+            return saved[1:] == (stat.st_size, stat.st_mtime_ns)
+
+        return self._size is not None and stat.st_size == self._size
+
+
+    def _remember_saved(self, path: Path) -> None:
+        """
+        .. warning:: `(for internal purposes)`
+        Remembers where the content of this file was saved, and how it was left. It must only
+        be called once a successful response was written whole, since other saves of the same
+        URL may copy it from there without asking the server. If what was written is not as
+        big as the server announced, it is not remembered.
+
+        :param path: The path in which the file was saved.
+
+        :type path: :class:`Path`
+        """
+
+        stat = path.stat()
+        if self._size is not None and stat.st_size != self._size:
+            return
+
+        _SAVED_PATHS.put(self.url, (path, stat.st_size, stat.st_mtime_ns))
 
 
     def save(self,
              path: Union["PathLike", Path]="",
              force: bool=True,
              verbose: bool=False,
-             chunk_size: int=4096) -> bool:
+             chunk_size: int=CHUNK_SIZE) -> bool:
         """
         Tries to save the file to a given path.
 
         :param path: The path in which to save the file.
-        :param force: If another file is found, overwrite it.
+        :param force: If another file is found, overwrite it. Otherwise, it is only replaced
+                      if the server has a different version of it than the one saved, or if
+                      the one saved can't be told apart from a truncated or edited one.
         :param verbose: Wether to track progress.
         :param chunk_size: The size `(in bytes)` of the chunks to download at a
                            time (usually a power of 2).
@@ -172,7 +359,10 @@ class File:
         :type verbose: :class:`bool`
         :type chunk_size: :class:`int`
 
-        :return: Wether or not the download was successful.
+        :raises requests.HTTPError: If the server answers with an error. The file already saved,
+                                    if any, is left untouched.
+
+        :return: Wether or not the file is saved and up to date.
         :rtype: :class:`bool`
         """
 
@@ -184,33 +374,58 @@ class File:
         if not path.suffix or path.is_dir():
             path /= self.name
 
-        if not path.exists():
-            path.parent.mkdir(parents=True, exist_ok=True)
-        elif path.exists() and not force:
-            return False
-        
-        response = get(self._rel_path, url_type=self._url_root, stream=True)
+        headers = None
+        if not force and path.exists():
+            if self._is_intact(path):
+                # the saved file has the modification date the server gave it
+                headers = {"If-Modified-Since": formatdate(path.stat().st_mtime, usegmt=True)}
+        elif self._copy_saved(path):
+            return True
+
+        response = get(self._rel_path, url_type=self._url_root, stream=True, headers=headers)
 
-        if self.content_type is None:
-            self._content_type = response.headers.get("content-type", None)
+        if response.status_code == 304 and headers is not None: # the saved file is up to date
+            response.close()
+            return True
 
-        w_mode = f"w{'b' if not self._is_text_mode() else ''}"
+        if not response.ok:
+            response.close()
+            response.raise_for_status()
+
+        self._update_headers(response.headers)
+
+        # downloaded aside first, so that a failed download never replaces a saved file
+        part_path = path.with_name(f"{path.name}.part")
+        # the raw stream yields bytes, even for text files
+        try:
+            context = part_path.open(mode="wb")
+        except FileNotFoundError: # only now it's known that the folder is missing
+            path.parent.mkdir(parents=True, exist_ok=True)
+            context = part_path.open(mode="wb")
 
-        context = path.open(mode=w_mode)
         if verbose:
             context = tqdm.wrapattr(context,
                                     "write",
                                     miniters=1,
                                     desc=f"->\t{self.name}",
-                                    total=int(response.headers.get("content-length", 0)),
+                                    total=(self.size or 0),
                                     ncols=BAR_WIDTH,
                                     leave=False,
                                     position=1,
                                     smoothing=1.0,
                                     colour="green")
 
-        with context as fout:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                fout.write(chunk)
+        try:
+            with response, context as fout:
+                response.raw.decode_content = True
+                copyfileobj(response.raw, fout, length=chunk_size)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        replace(part_path, path)
+        self._stamp_last_modified(path, response.headers.get("last-modified", None))
+        if 200 <= response.status_code < 300:
+            self._remember_saved(path)
 
         return True
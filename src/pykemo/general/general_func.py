@@ -4,8 +4,8 @@ Module for auxilair functions.
 
 from typing import TYPE_CHECKING, Optional
 
-from .._aux import FileHashResult, get_posts_responses
-from ..core import get
+from .._aux import DEFAULT_BATCH_SEND_SIZE, FileHashResult, date_filter, get_posts_responses
+from ..core import get, get_json, imap, json_body
 from ..creators import Creator, CreatorsList
 from ..discord import DiscordMessage
 from ..files import File
@@ -29,16 +29,29 @@ def get_creators() -> CreatorsList:
                  **ALL the creators on the site**. If you do not explicitly need this, do not use
                  it.
 
+    The profiles of the creators are requested concurrently, :attr:`.DEFAULT_BATCH_SEND_SIZE` at
+    a time, and each is processed and discarded as soon as it arrives. A creator whose profile
+    can't be retrieved, be it because it is not found or because its request keeps failing,
+    is left out instead of aborting the whole search.
+
     :returns: The list of all creators.
     :rtype: list[:class:`.Creator`]
     """
 
-    response = get("/creators.txt")
+    endpoints = [Creator.profile_endpoint(creator_fields.get("service"), creator_fields.get("id"))
+                 for creator_fields in get_json("/creators.txt")]
     creators = []
 
-    for creator_fields in response.json():
-        creators.append(get_creator(creator_fields.get("service"),
-                                    creator_fields.get("id")))
+    profile_responses = imap(endpoints,
+                             size=DEFAULT_BATCH_SEND_SIZE,
+                             exception_handler=lambda _request, _exception: None)
+    for profile_response in profile_responses:
+        if profile_response is None: # its request failed
+            continue
+
+        creator = Creator.from_profile_response(profile_response)
+        if creator is not None:
+            creators.append(creator)
 
     return creators
 
@@ -71,37 +84,50 @@ def get_posts(query: Optional[str]=None,
 
     response_bodies = get_posts_responses(endpoint="/posts",
                                           query=query,
-                                          max_posts=max_posts)
-    posts = []
-
+                                          max_posts=max_posts,
+                                          page_stepping=ELEMENTS_PER_PAGE)
+    in_bounds = date_filter(before, since)
+    posts_fields = []
     for post_fields in response_bodies:
-        published_str = post_fields["published"]
-        if ((before is not None and not Post.before_static(published_str, before)) or
-            (since is not None and not Post.since_static(published_str, since))):
-            continue
+        published, keep = in_bounds(post_fields["published"])
+        if keep:
+            post_fields.update(published=published)
+            posts_fields.append(post_fields)
+
+    creators = Creator.from_profiles((post_fields.get("service"), post_fields.get("user"))
+                                     for post_fields in posts_fields)
+    posts = []
 
-        post_fields.update(creator=get_creator(post_fields.get("service"),
-                                               post_fields.get("user")))
+    for post_fields in posts_fields:
+        post_fields.update(creator=creators[(post_fields.get("service"),
+                                             post_fields.get("user"))])
         posts.append(Post.from_dict(**post_fields))
 
     return posts
 
 
-def get_creator(service: "ServiceLike", creator_id: str) -> Optional[Creator]:
+def get_creator(service: "ServiceLike",
+                creator_id: str,
+                use_cache: bool=True) -> Optional[Creator]:
     """
     Tries to retrieve a creator with the given ID and service.
 
+    .. note:: A creator already retrieved before is not requested again, so its favorites and
+              dates may be outdated. Use ``use_cache=False`` to get the current ones.
+
     :param service: The service of the creator.
     :param creator_id: The ID of the creator.
+    :param use_cache: Wether a creator already retrieved may be used instead of requesting it.
 
     :type service: :type:`.ServiceLike`
     :type creator_Id: :class:`str`
+    :type use_cache: :class:`bool`
 
     :return: The creator instance, if found. Otherwise returns ``None``.
     :rtype: Optional[:class:`.Creator`]
     """
 
-    return Creator.from_profile(service, creator_id)
+    return Creator.from_profile(service, creator_id, use_cache=use_cache)
 
 
 def get_creator_links(service: "ServiceLike", creator_id: str) -> CreatorsList:
@@ -139,7 +165,7 @@ def get_file_hash(hash: str) -> FileHashResult:
     if response.status_code == 404:
         return FileHashResult.empty()
 
-    body = response.json()
+    body = json_body(response)
 
     ext = body.get("ext")
 
@@ -150,9 +176,11 @@ def get_file_hash(hash: str) -> FileHashResult:
     posts_list = []
     posts_res = body.get("posts", None)
     posts = (posts_res if posts_res is not None else [])
+    creators = Creator.from_profiles((post_fields.get("service"), post_fields.get("user"))
+                                     for post_fields in posts)
     for post_fields in posts:
-        post_fields.update(creator=get_creator(post_fields.get("service"),
-                                               post_fields.get("user")))
+        post_fields.update(creator=creators[(post_fields.get("service"),
+                                             post_fields.get("user"))])
         posts_list.append(Post.from_dict(**post_fields))
 
     msgs_list = []
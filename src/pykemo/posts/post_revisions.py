@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from .posts import Post
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PostRevision:
     """
     A post revision is an edit made to a post, at any given time.
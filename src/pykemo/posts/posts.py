@@ -4,14 +4,17 @@ Posts module.
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, TypeAlias, Union
+from typing import TYPE_CHECKING, Iterator, Optional, TypeAlias, Union
 
+from grequests import Pool
+from requests import RequestException
 from tqdm import tqdm
 
-from .._aux import DEFAULT_DATE_FMT, sanitize_data_url
+from .._aux import parse_date, sanitize_data_url
 from ..comments import Comment
-from ..core import UrlType, get
+from ..core import UrlType, get, get_json, user_endpoint
 from ..files import BAR_WIDTH, File, FilesList
 from .post_revisions import PostRevision
 
@@ -32,8 +35,13 @@ This is how the API ortganizes the posts and other things.
 Each 'page' has fifty (50) elements at most.
 """
 
+SAVE_POOL_SIZE: int = 8
+"""
+How many files of a post to download at the same time when saving it.
+"""
+
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Post:
     """
     Post with content.
@@ -97,6 +105,8 @@ class Post:
     _revisions: PostRevsList = field(default_factory=list, init=False, repr=False)
     __revs_loaded: bool = field(default=False, init=False, repr=False)
 
+    _url: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
 
     @classmethod
     def from_dict(cls, **fields) -> "Post":
@@ -108,17 +118,17 @@ class Post:
         """
 
         added_field = fields.get("added", None)
-        added = (datetime.strptime(added_field, rf"{DEFAULT_DATE_FMT}.%f")
+        added = (parse_date(added_field)
                  if added_field is not None
                  else None)
         
         edited_field = fields.get("edited", None)
-        edited = (datetime.strptime(edited_field, DEFAULT_DATE_FMT)
+        edited = (parse_date(edited_field)
                  if edited_field is not None
                  else None)
         
         file_dict = fields.get("file")
-        attachments = fields.get("attachments")
+        attachments = fields.get("attachments", ())
 
         return cls(
             id=fields.get("id"),
@@ -130,7 +140,7 @@ class Post:
             embed=fields.get("embed", {}),
             shared_file=fields.get("shared_file", False),
             added=added,
-            published=datetime.strptime(fields.get("published"), DEFAULT_DATE_FMT),
+            published=parse_date(fields.get("published")),
             edited=edited,
             file=(File.from_dict(**sanitize_data_url(file_dict)) if file_dict else None),
             attachments=[File.from_dict(**sanitize_data_url(attachment_fields))
@@ -188,19 +198,24 @@ class Post:
         :rtype: :type:`.UrlLike`
         """
 
-        return f"{UrlType.SITE}/{self.service}/user/{self.creator_id}/post/{self.id}"
+        if self._url is None:
+            self._url = UrlType.SITE + user_endpoint(self.service,
+                                                     self.creator_id,
+                                                     f"/post/{self.id}")
+
+        return self._url
 
 
     @property
-    def _all_files(self) -> FilesList:
+    def _all_files(self) -> Iterator[File]:
         """
         .. warning:: `(for internal purposes)`
 
         :return: Both the preview file and the attachments, if any.
-        :rtype: list[:class:`.File`]
+        :rtype: Iterator[:class:`.File`]
         """
 
-        return ([self.file] if self.file is not None else []) + self.attachments
+        return chain((self.file,) if self.file is not None else (), self.attachments)
 
 
     def before(self, date: datetime) -> bool:
@@ -230,7 +245,7 @@ class Post:
              force: bool=True,
              verbose: bool=True) -> bool:
         """
-        Tries to save all the files in the post.
+        Tries to save all the files in the post, downloading up to :attr:`SAVE_POOL_SIZE` of them at a time.
 
         :param path: The optional path where to store all the files. If it ends with '/*', it
                      will use its default name inside such folder.
@@ -245,19 +260,13 @@ class Post:
         :rtype: :class:`bool`
         """
 
-        files = self._all_files
-        if verbose:
-            if not files:
-                print(f"Post '{self.title}' doesn't have files to download. Ignoring...")
-                return False
-
-            files = tqdm(files,
-                         desc=f"Post '{self.title}'",
-                         ncols=BAR_WIDTH,
-                         unit="file",
-                         position=0,
-                         smoothing=1.0,
-                         colour="blue")
+        # all of them are saved in the same folder, so files that share a name would race for
+        # the same path while downloading concurrently; just like when they were downloaded
+        # one after the other, the last one of them is the one that ends up saved
+        files = list({file.name: file for file in self._all_files}.values())
+        if verbose and not files:
+            print(f"Post '{self.title}' doesn't have files to download. Ignoring...")
+            return False
 
         if path is None:
             path = Path(self.title)
@@ -268,11 +277,32 @@ class Post:
 
         path.mkdir(parents=True, exist_ok=True)
 
-        for file in files:
-            if not file.save(path, force=force, verbose=verbose):
-                return False
+        # downloads are network-bound, so they are overlapped; their own
+        # progress bars would clash with each other, hence only the post's is shown
+        def save_file(file: File) -> Union[bool, Exception]:
+            try:
+                return file.save(path, force=force)
+            except (RequestException, OSError) as exc: # re-raised below, outside of the pool
+                return exc
+
+        pool = Pool(max(1, min(SAVE_POOL_SIZE, len(files))))
+        saved = pool.imap_unordered(save_file, files)
+        if verbose:
+            saved = tqdm(saved,
+                         total=len(files),
+                         desc=f"Post '{self.title}'",
+                         ncols=BAR_WIDTH,
+                         unit="file",
+                         position=0,
+                         smoothing=1.0,
+                         colour="blue")
+
+        results = list(saved)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
-        return True
+        return all(results)
 
 
     def fetch_comments(self) -> CommentsList:
@@ -284,10 +314,10 @@ class Post:
         :rtype: list[:class:`.Comment`]
         """
 
-        response = get(f"/{self.service}/user/{self.creator_id}/post/{self.id}/comments")
         comments = []
 
-        for comment_fields in response.json():
+        endpoint = user_endpoint(self.service, self.creator_id, f"/post/{self.id}/comments")
+        for comment_fields in get_json(endpoint):
             comment_fields.update(creator=self.creator, post=self)
             comments.append(Comment.from_dict(**comment_fields))
 
@@ -304,7 +334,7 @@ class Post:
         :rtype: :class:`bool`
         """
 
-        response = get(f"/{self.service}/user/{self.creator_id}/post/{self.id}/flag")
+        response = get(user_endpoint(self.service, self.creator_id, f"/post/{self.id}/flag"))
         return response.status_code == 200
 
 
@@ -317,10 +347,10 @@ class Post:
         :rtype: list[:class:`.PostRevision`]
         """
 
-        response = get(f"/{self.service}/user/{self.creator_id}/post/{self.id}/revisions")
         revisions = []
 
-        for revs_fields in response.json():
+        endpoint = user_endpoint(self.service, self.creator_id, f"/post/{self.id}/revisions")
+        for revs_fields in get_json(endpoint):
             revs_fields.update(creator=self.creator, is_revision=True)
             subpost = Post.from_dict(**revs_fields)
 
@@ -1,3 +1,7 @@
 """
 Tests package.
-"""
\ No newline at end of file
+"""
+
+from .test_aux import AuxClassesTests, DatesTests, PostsResponsesTests, QueryParamsTests
+from .test_core import SessionTests
+from .test_files import FileSaveTests
@@ -0,0 +1,129 @@
+"""
+Tests for the auxiliar tools.
+"""
+
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import patch
+
+from ..pykemo._aux import (
+    DEFAULT_BATCH_SEND_SIZE,
+    PAGES_WINDOW,
+    FileHashResult,
+    LRUCache,
+    async_get_posts_responses,
+    aux_funcs,
+    date_filter,
+    get_posts_responses,
+    parse_date,
+    query_params,
+)
+
+
+def _no_responses(*_args, **_kwargs):
+    "Streams no responses at all, as if every page was empty."
+
+    yield from ()
+
+
+class QueryParamsTests(TestCase):
+    "Tests for the parameters sent when querying pages."
+
+    def test_without_offset(self) -> None:
+        self.assertEqual(query_params(), {})
+        self.assertEqual(query_params("cats"), {"q": "cats"})
+
+
+    def test_with_offset(self) -> None:
+        self.assertEqual(query_params("cats", 100, 50), {"q": "cats", "o": 100})
+        self.assertEqual(query_params(offset=0, stepping=50), {"o": 0})
+
+
+    def test_offset_not_multiple_of_stepping(self) -> None:
+        with self.assertRaises(ValueError):
+            query_params(offset=75, stepping=50)
+
+
+class PostsResponsesTests(TestCase):
+    "Tests for how many pages of posts are requested at the same time."
+
+    def test_async_default_send_size(self) -> None:
+        with patch.object(aux_funcs, "imap_requests", side_effect=_no_responses) as imap_requests:
+            list(async_get_posts_responses(endpoint="/x", max_posts=10, page_stepping=50))
+
+        self.assertEqual(imap_requests.call_args.kwargs["size"], DEFAULT_BATCH_SEND_SIZE)
+
+
+    def test_async_given_send_size(self) -> None:
+        with patch.object(aux_funcs, "imap_requests", side_effect=_no_responses) as imap_requests:
+            list(async_get_posts_responses(endpoint="/x",
+                                           max_posts=10,
+                                           page_stepping=50,
+                                           batch_send_size=3))
+
+        self.assertEqual(imap_requests.call_args.kwargs["size"], 3)
+
+
+    def test_sync_send_size(self) -> None:
+        with patch.object(aux_funcs, "async_map", return_value=[]) as async_map:
+            list(get_posts_responses(endpoint="/x", max_posts=10, page_stepping=50))
+            self.assertEqual(async_map.call_args.kwargs["size"], PAGES_WINDOW)
+
+            list(get_posts_responses(endpoint="/x",
+                                     max_posts=10,
+                                     page_stepping=50,
+                                     batch_send_size=3))
+            self.assertEqual(async_map.call_args.kwargs["size"], 3)
+
+
+class DatesTests(TestCase):
+    "Tests for the parsing and filtering of dates."
+
+    def test_parse_date(self) -> None:
+        self.assertEqual(parse_date("2024-01-02T03:04:05"), datetime(2024, 1, 2, 3, 4, 5))
+        self.assertEqual(parse_date("2024-01-02T03:04:05.5Z"),
+                         datetime(2024, 1, 2, 3, 4, 5, 500000))
+
+        date = datetime(2024, 1, 2)
+        self.assertIs(parse_date(date), date)
+
+
+    def test_date_filter(self) -> None:
+        in_bounds = date_filter(before=datetime(2024, 1, 3), since=datetime(2024, 1, 2))
+
+        self.assertEqual(in_bounds("2024-01-02T00:00:00"), (datetime(2024, 1, 2), True))
+        self.assertEqual(in_bounds("2024-01-01T00:00:00"), (datetime(2024, 1, 1), False))
+        self.assertEqual(in_bounds("2024-01-03T00:00:00"), (datetime(2024, 1, 3), False))
+        self.assertEqual(date_filter()("2024-01-01T00:00:00"), (datetime(2024, 1, 1), True))
+
+
+class AuxClassesTests(TestCase):
+    "Tests for the auxiliar classes."
+
+    def test_empty_file_hash_result(self) -> None:
+        empty = FileHashResult.empty()
+
+        self.assertIs(empty, FileHashResult.empty())
+        self.assertIsNone(empty.file)
+        self.assertEqual(len(empty.posts), 0)
+        self.assertEqual(len(empty.disc), 0)
+
+        with self.assertRaises(FrozenInstanceError):
+            empty.file = None
+
+
+    def test_lru_cache(self) -> None:
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1) # now "b" is the least recently used
+        cache.put("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
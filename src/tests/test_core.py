@@ -0,0 +1,47 @@
+"""
+Tests for the shared session.
+"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from ..pykemo.core import (
+    ADAPTER_PREFIX,
+    POOL_MAXSIZE,
+    JitterRetry,
+    close_session,
+    configure_pool,
+)
+from ..pykemo.core.request import _SESSION
+
+
+class SessionTests(TestCase):
+    "Tests for managing the connections of the shared session."
+
+    @staticmethod
+    def _adapter():
+        return _SESSION.adapters[ADAPTER_PREFIX]
+
+
+    def test_configure_pool(self) -> None:
+        self.addCleanup(configure_pool, POOL_MAXSIZE)
+        old_adapter = self._adapter()
+
+        with patch.object(old_adapter, "close") as close:
+            configure_pool(POOL_MAXSIZE * 2)
+
+        close.assert_called_once()
+        self.assertIsNot(self._adapter(), old_adapter)
+        self.assertEqual(self._adapter()._pool_maxsize, POOL_MAXSIZE * 2)
+        self.assertIsInstance(self._adapter().max_retries, JitterRetry) # same retry policy
+        self.assertEqual(self._adapter().max_retries.total, old_adapter.max_retries.total)
+
+
+    def test_close_session(self) -> None:
+        adapter = self._adapter()
+
+        with patch.object(adapter, "close") as close:
+            close_session()
+
+        close.assert_called_once()
+        self.assertIs(self._adapter(), adapter) # still mounted, so it can be used again
@@ -0,0 +1,133 @@
+"""
+Tests for the saving of files.
+"""
+
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests import HTTPError, Response
+
+from ..pykemo.files import File, clear_saved_files_cache
+from ..pykemo.files import files as files_module
+
+LAST_MODIFIED: str = "Wed, 21 Oct 2015 07:28:00 GMT"
+"The date the server says the file was last modified."
+
+
+def _response(status_code: int, content: bytes=b"", headers: dict[str, str]=None) -> Response:
+    """
+    Builds a response as the server would send it, already received.
+    """
+
+    response = Response()
+    response.status_code = status_code
+    response.headers.update({"content-length": str(len(content)), "last-modified": LAST_MODIFIED}
+                            if status_code == 200 else {})
+    response.headers.update(headers or {})
+    response.raw = BytesIO(content)
+    return response
+
+
+class FileSaveTests(TestCase):
+    "Tests for saving files, and how they are saved again."
+
+    def setUp(self) -> None:
+        clear_saved_files_cache()
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.dir = Path(tmp_dir.name)
+
+
+    @staticmethod
+    def _new_file() -> File:
+        return File(name="a.txt", path="/a.txt", url_source="https://example.com")
+
+
+    def _save(self, file: File, path: Path, *responses: Response, **kwargs) -> tuple[bool, list]:
+        with patch.object(files_module, "get", side_effect=responses) as get:
+            saved = file.save(path, **kwargs)
+
+        return saved, get.call_args_list
+
+
+    def test_save(self) -> None:
+        path = self.dir / "a.txt"
+        saved, calls = self._save(self._new_file(), path, _response(200, b"hello"))
+
+        self.assertTrue(saved)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(path.read_bytes(), b"hello")
+        self.assertFalse(path.with_name("a.txt.part").exists())
+
+
+    def test_conditional_save_not_modified(self) -> None:
+        path = self.dir / "a.txt"
+        self._save(self._new_file(), path, _response(200, b"hello"))
+
+        saved, calls = self._save(self._new_file(), path, _response(304), force=False)
+
+        self.assertTrue(saved)
+        self.assertEqual(calls[0].kwargs["headers"], {"If-Modified-Since": LAST_MODIFIED})
+        self.assertEqual(path.read_bytes(), b"hello")
+
+
+    def test_conditional_save_modified(self) -> None:
+        path = self.dir / "a.txt"
+        self._save(self._new_file(), path, _response(200, b"hello"))
+
+        saved, calls = self._save(self._new_file(), path, _response(200, b"bye"), force=False)
+
+        self.assertTrue(saved)
+        self.assertIsNotNone(calls[0].kwargs["headers"])
+        self.assertEqual(path.read_bytes(), b"bye")
+
+
+    def test_conditional_save_of_edited_file(self) -> None:
+        path = self.dir / "a.txt"
+        self._save(self._new_file(), path, _response(200, b"hello"))
+        path.write_bytes(b"hello, world")
+
+        saved, calls = self._save(self._new_file(), path, _response(200, b"hello"), force=False)
+
+        self.assertTrue(saved)
+        self.assertIsNone(calls[0].kwargs["headers"]) # its date can't be trusted anymore
+        self.assertEqual(path.read_bytes(), b"hello")
+
+
+    def test_copy_saved(self) -> None:
+        first_path = self.dir / "a.txt"
+        second_path = self.dir / "copy" / "a.txt"
+        self._save(self._new_file(), first_path, _response(200, b"hello"))
+
+        saved, calls = self._save(self._new_file(), second_path)
+
+        self.assertTrue(saved)
+        self.assertEqual(len(calls), 0)
+        self.assertEqual(second_path.read_bytes(), b"hello")
+
+
+    def test_copy_saved_of_edited_file(self) -> None:
+        first_path = self.dir / "a.txt"
+        second_path = self.dir / "b.txt"
+        self._save(self._new_file(), first_path, _response(200, b"hello"))
+        first_path.write_bytes(b"bye")
+
+        saved, calls = self._save(self._new_file(), second_path, _response(200, b"hello"))
+
+        self.assertTrue(saved)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(second_path.read_bytes(), b"hello")
+
+
+    def test_failed_save_keeps_file(self) -> None:
+        path = self.dir / "a.txt"
+        self._save(self._new_file(), path, _response(200, b"hello"))
+
+        with self.assertRaises(HTTPError):
+            self._save(self._new_file(), path, _response(404))
+
+        self.assertEqual(path.read_bytes(), b"hello")
+        self.assertFalse(path.with_name("a.txt.part").exists())